@@ -4,7 +4,7 @@ import json
 import os
 from functools import cached_property, lru_cache
 from pathlib import Path
-from typing import Literal, Optional
+from typing import Literal, Optional, Union
 
 from pydantic import BaseModel, ConfigDict, Field, ValidationError
 from pydantic_settings import BaseSettings, SettingsConfigDict
@@ -13,6 +13,14 @@ from pydantic_settings import BaseSettings, SettingsConfigDict
 class ModelDefaults(BaseModel):
     temperature: float = 0.3
     max_output_tokens: int = 4096
+    batch_concurrency: int = Field(8, ge=1)
+    model_config = ConfigDict(extra="forbid", populate_by_name=True)
+
+
+class HttpPoolConfig(BaseModel):
+    max_connections: int = Field(100, ge=1)
+    max_keepalive_connections: int = Field(20, ge=0)
+    keepalive_expiry_seconds: float = Field(90.0, ge=0)
     model_config = ConfigDict(extra="forbid", populate_by_name=True)
 
 
@@ -21,6 +29,9 @@ class OpenAIModelConfig(BaseModel):
     conversation_model: Optional[str] = None
     reasoning_effort: str
     api_key: Optional[str] = None
+    http_pool: HttpPoolConfig = Field(
+        default_factory=lambda: HttpPoolConfig(max_connections=200, max_keepalive_connections=50)
+    )
     model_config = ConfigDict(extra="forbid", populate_by_name=True)
 
     def conversation_model_name(self) -> str:
@@ -32,6 +43,10 @@ class OllamaModelConfig(BaseModel):
     timeout_seconds: float = 60.0
     response_model: str
     conversation_model: Optional[str] = None
+    max_concurrency: Optional[int] = Field(None, ge=1)
+    # Ollama takes a duration string ("30m") or seconds as a number (-1 keeps the model loaded, 0 unloads it).
+    keep_alive: Optional[Union[int, str]] = None
+    http_pool: HttpPoolConfig = Field(default_factory=HttpPoolConfig)
     model_config = ConfigDict(extra="forbid", populate_by_name=True)
 
     def conversation_model_name(self) -> str:
@@ -6,6 +6,7 @@ from typing import Any, Dict, List, Optional, Protocol
 
 from app.db.models import CaseDocument, CaseRecord
 from app.db.session import get_session
+from app.utils.case_ids import normalize_case_id
 
 
 @dataclass(frozen=True)
@@ -37,7 +38,7 @@ class SqlCaseDocumentStore(CaseDocumentStore):
         self._session_factory = get_session
 
     def get(self, case_id: str) -> Optional[StoredCaseDocuments]:
-        key = _normalize_case_id(case_id)
+        key = normalize_case_id(case_id)
         session = self._session_factory()
         try:
             case = session.get(CaseRecord, key)
@@ -85,7 +86,7 @@ class SqlCaseDocumentStore(CaseDocumentStore):
     def set(self, case_id: str, documents: List[Dict[str, Any]], case_title: str) -> None:
         if not isinstance(case_title, str) or not case_title.strip():
             raise ValueError("case_title is required when caching case documents.")
-        key = _normalize_case_id(case_id)
+        key = normalize_case_id(case_id)
         session = self._session_factory()
         try:
             session.query(CaseDocument).filter(CaseDocument.case_id == key).delete()
@@ -133,7 +134,7 @@ class SqlCaseDocumentStore(CaseDocumentStore):
             session.close()
 
     def clear(self, case_id: str) -> None:
-        key = _normalize_case_id(case_id)
+        key = normalize_case_id(case_id)
         session = self._session_factory()
         try:
             session.query(CaseDocument).filter(CaseDocument.case_id == key).delete()
@@ -144,10 +145,3 @@ class SqlCaseDocumentStore(CaseDocumentStore):
             raise
         finally:
             session.close()
-
-
-def _normalize_case_id(case_id: str) -> str:
-    try:
-        return str(int(case_id))
-    except (TypeError, ValueError):
-        return str(case_id)
@@ -8,6 +8,7 @@ from app.db.models import ChecklistItem as ChecklistItemRow
 from app.db.models import ChecklistRecord
 from app.db.session import get_session
 from app.schemas.checklists import EvidenceCollection, EvidenceItem, EvidencePointer
+from app.utils.case_ids import normalize_case_id
 
 producer = get_event_producer(__name__)
 
@@ -50,7 +51,7 @@ class SqlDocumentChecklistStore(DocumentChecklistStore):
         self._session_factory = get_session
 
     def get(self, case_id: str) -> Optional[StoredDocumentChecklist]:
-        key = _normalize_case_id(case_id)
+        key = normalize_case_id(case_id)
         session = self._session_factory()
         try:
             record = session.get(ChecklistRecord, key)
@@ -94,7 +95,7 @@ class SqlDocumentChecklistStore(DocumentChecklistStore):
         items: DocumentChecklistPayload,
         version: str,
     ) -> None:
-        key = _normalize_case_id(case_id)
+        key = normalize_case_id(case_id)
         session = self._session_factory()
         try:
             session.query(ChecklistItemRow).filter(ChecklistItemRow.case_id == key).delete()
@@ -124,7 +125,7 @@ class SqlDocumentChecklistStore(DocumentChecklistStore):
             session.close()
 
     def clear(self, case_id: str) -> None:
-        key = _normalize_case_id(case_id)
+        key = normalize_case_id(case_id)
         session = self._session_factory()
         try:
             session.query(ChecklistItemRow).filter(ChecklistItemRow.case_id == key).delete()
@@ -135,12 +136,3 @@ class SqlDocumentChecklistStore(DocumentChecklistStore):
             raise
         finally:
             session.close()
-
-
-def _normalize_case_id(case_id: str) -> str:
-    """Ensure case identifiers serialize consistently."""
-    try:
-        # Preserve numeric IDs as canonical decimal strings for compatibility with JSON object keys.
-        return str(int(case_id))
-    except (TypeError, ValueError):
-        return str(case_id)
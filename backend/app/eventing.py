@@ -8,13 +8,18 @@ import threading
 from dataclasses import dataclass
 from datetime import datetime, timezone
 from enum import IntEnum
-from functools import lru_cache
+from functools import cached_property, lru_cache
 from pathlib import Path
 from typing import Any, Dict, List, Optional, Protocol
 from contextvars import ContextVar, Token
 
+import orjson
+
 from app.core.config import Settings
 
+# Upper bound on events drained from the queue before consumers are flushed.
+_MAX_EVENT_BATCH = 256
+
 
 class EventVisibility(IntEnum):
     TRACE = 10
@@ -45,6 +50,25 @@ class Event:
             data["case_id"] = self.case_id
         return data
 
+    @cached_property
+    def json_line(self) -> str:
+        # Shared by the file and socket consumers so each event is serialised once.
+        return _dump_json(self.to_dict()) + "\n"
+
+
+def _dump_json(data: Any) -> str:
+    try:
+        # Event payloads are almost always JSON-native; skip the default= hook unless needed.
+        return orjson.dumps(data, option=orjson.OPT_NON_STR_KEYS).decode("utf-8")
+    except orjson.JSONEncodeError:
+        pass
+    try:
+        return orjson.dumps(data, default=str, option=orjson.OPT_NON_STR_KEYS).decode("utf-8")
+    except orjson.JSONEncodeError:
+        # orjson rejects a few values the stdlib accepts (e.g. integers wider than 64 bits).
+        # Match orjson's compact, UTF-8 output so every line in a log has the same format.
+        return json.dumps(data, default=str, separators=(",", ":"), ensure_ascii=False)
+
 
 class EventConsumer(Protocol):
     def accepts(self, level: EventVisibility) -> bool:
@@ -53,6 +77,9 @@ class EventConsumer(Protocol):
     async def handle_event(self, event: Event) -> None:
         ...
 
+    async def flush(self) -> None:
+        ...
+
 
 class BaseEventConsumer:
     def __init__(self, *, min_level: EventVisibility) -> None:
@@ -61,6 +88,16 @@ class BaseEventConsumer:
     def accepts(self, level: EventVisibility) -> bool:
         return level >= self._min_level
 
+    async def flush(self) -> None:
+        return None
+
+
+def _report_consumer_error(consumer: EventConsumer, action: str, exc: BaseException) -> None:
+    # Written straight to stderr: the failing consumer may be the sink an error event would go to.
+    sys.stderr.write(
+        f"{_current_timestamp()} ERROR {__name__}: {type(consumer).__name__}.{action} failed: {exc!r}\n"
+    )
+
 
 class FileEventConsumer(BaseEventConsumer):
     def __init__(self, path: Path, *, min_level: EventVisibility = EventVisibility.DEBUG) -> None:
@@ -70,8 +107,9 @@ class FileEventConsumer(BaseEventConsumer):
         self._file = self._path.open("a", encoding="utf-8")
 
     async def handle_event(self, event: Event) -> None:
-        line = json.dumps(event.to_dict(), default=str)
-        self._file.write(line + "\n")
+        self._file.write(event.json_line)
+
+    async def flush(self) -> None:
         self._file.flush()
 
     async def close(self) -> None:
@@ -85,11 +123,13 @@ class ConsoleEventConsumer(BaseEventConsumer):
     async def handle_event(self, event: Event) -> None:
         payload = ""
         if event.payload:
-            payload = f" {json.dumps(event.payload, default=str)}"
+            payload = f" {_dump_json(event.payload)}"
         case_hint = f" case_id={event.case_id}" if event.case_id else ""
         sys.stdout.write(
             f"{event.timestamp} {event.visibility.name} {event.producer}{case_hint}: {event.description}{payload}\n"
         )
+
+    async def flush(self) -> None:
         sys.stdout.flush()
 
 
@@ -122,7 +162,7 @@ class UnixSocketEventConsumer(BaseEventConsumer):
             await writer.wait_closed()
 
     async def handle_event(self, event: Event) -> None:
-        data = (json.dumps(event.to_dict(), default=str) + "\n").encode("utf-8")
+        data = event.json_line.encode("utf-8")
         async with self._connections_lock:
             connections = list(self._connections)
         if not connections:
@@ -184,23 +224,51 @@ class EventManager:
             return
         self._task = asyncio.create_task(self._run())
 
+    def _drain(self, first: object) -> tuple[List[object], bool]:
+        batch = [first]
+        while len(batch) < _MAX_EVENT_BATCH:
+            try:
+                batch.append(self._queue.get_nowait())
+            except queue.Empty:
+                break
+        if self._stop_signal in batch:
+            return batch[: batch.index(self._stop_signal)], True
+        return batch, False
+
     async def _run(self) -> None:
         while True:
             try:
-                event = await asyncio.to_thread(self._queue.get)
+                first = await asyncio.to_thread(self._queue.get)
             except asyncio.CancelledError:
                 break
-            if event is self._stop_signal:
+            # Handle whatever else is already queued before flushing, so bursts cost one flush.
+            batch, stopping = self._drain(first)
+            consumers = self._snapshot_consumers()
+            if consumers:
+                await self._dispatch(batch, consumers)
+                await self._flush_consumers(consumers)
+            if stopping:
                 break
+
+    async def _dispatch(self, batch: List[object], consumers: List[EventConsumer]) -> None:
+        for event in batch:
             if not isinstance(event, Event):
                 continue
-            consumers = self._snapshot_consumers()
-            if not consumers:
-                continue
-            await asyncio.gather(
-                *(consumer.handle_event(event) for consumer in consumers if consumer.accepts(event.visibility)),
+            accepting = [consumer for consumer in consumers if consumer.accepts(event.visibility)]
+            results = await asyncio.gather(
+                *(consumer.handle_event(event) for consumer in accepting),
                 return_exceptions=True,
             )
+            for consumer, result in zip(accepting, results):
+                if isinstance(result, Exception):
+                    _report_consumer_error(consumer, "handle_event", result)
+
+    async def _flush_consumers(self, consumers: List[EventConsumer]) -> None:
+        for consumer in consumers:
+            try:
+                await consumer.flush()
+            except Exception as exc:  # pylint: disable=broad-except
+                _report_consumer_error(consumer, "flush", exc)
 
     async def close(self) -> None:
         if self._task and not self._task.done():
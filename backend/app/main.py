@@ -1,5 +1,7 @@
 from __future__ import annotations
 
+import asyncio
+
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
 
@@ -7,7 +9,8 @@ from app.api.router import api_router
 from app.core.config import get_settings
 from app.db.session import init_db
 from app.eventing import get_event_producer, init_event_system, shutdown_event_system
-from app.services.llm import llm_service
+from app.services.documents import flush_pending_writes
+from app.services.llm import get_llm_service, shutdown_llm_service
 
 settings = get_settings()
 producer = get_event_producer(__name__)
@@ -29,6 +32,8 @@ app.include_router(api_router)
 async def startup_event() -> None:
     init_db()
     await init_event_system(settings)
+    # Build the LLM backend inside the running loop so its connection pool is owned by this worker.
+    get_llm_service()
     producer.info(
         "Backend startup",
         {"app_name": settings.app_name, "environment": settings.environment},
@@ -38,5 +43,7 @@ async def startup_event() -> None:
 @app.on_event("shutdown")
 async def shutdown_event() -> None:
     producer.info("Backend shutdown")
-    await llm_service.shutdown()
+    # Case documents are persisted write-behind; finish queued writes before the process exits.
+    await asyncio.to_thread(flush_pending_writes)
+    await shutdown_llm_service()
     await shutdown_event_system()
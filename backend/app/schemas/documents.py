@@ -1,5 +1,8 @@
 from __future__ import annotations
 
+from datetime import datetime
+from functools import lru_cache
+from operator import attrgetter
 from typing import List, Optional
 
 from pydantic import AliasChoices, BaseModel, ConfigDict, Field
@@ -72,7 +75,13 @@ class DocumentMetadata(BaseModel):
 
 class Document(DocumentMetadata):
     content: str = Field(..., description="Full document body as plain text")
-    model_config = ConfigDict(extra="forbid", populate_by_name=True)
+    model_config = ConfigDict(extra="forbid", populate_by_name=True, frozen=True)
+
+    @property
+    def sort_key(self) -> tuple:
+        """Docket first, then newest filing date first, then undated documents."""
+        # Derived on access so model_copy(update=...) can never leave a stale key behind.
+        return document_sort_key(self.is_docket, self.date, self.id)
 
 
 class DocumentListResponse(BaseModel):
@@ -113,6 +122,11 @@ class DocumentReference(BaseModel):
     )
     model_config = ConfigDict(extra="forbid", populate_by_name=True)
 
+    @property
+    def sort_key(self) -> tuple:
+        """Same ordering as Document.sort_key."""
+        return document_sort_key(self.is_docket, self.date, self.id)
+
 
 class DocumentChunk(BaseModel):
     id: str
@@ -120,3 +134,27 @@ class DocumentChunk(BaseModel):
     start: int
     end: int
     model_config = ConfigDict(extra="forbid", populate_by_name=True)
+
+
+# Sorting re-reads every key, and a case's filing dates repeat across calls.
+@lru_cache(maxsize=4096)
+def _parse_date(value: Optional[str]) -> Optional[datetime]:
+    if not value:
+        return None
+    try:
+        return datetime.fromisoformat(value)
+    except ValueError:
+        return None
+
+
+def document_sort_key(is_docket: bool, date: Optional[str], document_id: int) -> tuple:
+    if is_docket:
+        return (0, document_id)
+    date_value = _parse_date(date)
+    if date_value is None:
+        return (1, 1, 0, document_id)
+    return (1, 0, -date_value.timestamp(), document_id)
+
+
+# Sort key getter for Document and DocumentReference lists.
+DOCUMENT_SORT_KEY = attrgetter("sort_key")
@@ -11,7 +11,7 @@ import yaml
 
 from app.eventing import get_event_producer
 from app.core.config import get_settings
-from app.services.llm import llm_service, LLMMessage, LLMResult
+from app.services.llm import get_llm_service, LLMMessage, LLMResult
 from app.services.agent.schemas import Snapshot, OrchestratorAction
 from app.services.agent.tools import BaseTool, StopTool
 
@@ -160,7 +160,7 @@ class Orchestrator:
         
         try:
             # Native Tool Call via LLM Service
-            result: LLMResult = await llm_service.chat(
+            result: LLMResult = await get_llm_service().chat(
                 messages,
                 system=system_prompt,
                 tools=tool_schemas
@@ -18,7 +18,7 @@ from app.schemas.chat import (
     ChatSession,
     SummaryPatch,
 )
-from app.services.llm import LLMMessage, LLMToolCall, LLMToolHandlerResult, llm_service
+from app.services.llm import LLMMessage, LLMToolCall, LLMToolHandlerResult, get_llm_service
 
 _chat_sessions: Dict[str, ChatSession] = {}
 _chat_lock = asyncio.Lock()
@@ -93,7 +93,7 @@ async def post_message(session_id: str, payload: ChatMessageRequest) -> ChatMess
         )
     )
 
-    llm_result = await llm_service.chat_with_tools(
+    llm_result = await get_llm_service().chat_with_tools(
         llm_messages,
         system=_SYSTEM_PROMPT,
         tools=_SUMMARY_EDIT_TOOLS,
@@ -1,7 +1,6 @@
 from __future__ import annotations
 
 import asyncio
-from datetime import datetime
 import json
 from pathlib import Path
 from typing import Dict, List, Optional
@@ -22,7 +21,7 @@ from app.schemas.checklists import (
     EvidenceItem,
     EvidencePointer,
 )
-from app.schemas.documents import DocumentReference
+from app.schemas.documents import DOCUMENT_SORT_KEY, DocumentReference
 from app.services.documents import get_document
 
 producer = get_event_producer(__name__)
@@ -65,7 +64,6 @@ _CATEGORY_ORDER = [category["id"] for category in _CATEGORY_METADATA if isinstan
 
 _DOCUMENT_CHECKLIST_STORE: DocumentChecklistStore = SqlDocumentChecklistStore()
 
-
 class ExtractionRunManager:
     """Monolithic coordinator for checklist extraction runs keyed by case_id."""
 
@@ -78,7 +76,7 @@ class ExtractionRunManager:
         stored = self._store.get(case_id)
         if stored is None:
             return None
-        sorted_docs = sorted(documents, key=_document_sort_key)
+        sorted_docs = sorted(documents, key=DOCUMENT_SORT_KEY)
         text_lookup = _build_text_lookup_from_references(case_id, sorted_docs)
         sanitized_items = _strip_sentence_ids_from_collection(stored.items, text_lookup)
         if sanitized_items != stored.items:
@@ -92,7 +90,7 @@ class ExtractionRunManager:
     async def ensure_record(self, case_id: str, documents: List[DocumentReference]) -> StoredDocumentChecklist:
         stored = self._store.get(case_id)
         if stored is not None:
-            sorted_docs = sorted(documents, key=_document_sort_key)
+            sorted_docs = sorted(documents, key=DOCUMENT_SORT_KEY)
             text_lookup = _build_text_lookup_from_references(case_id, sorted_docs)
             sanitized_items = _strip_sentence_ids_from_collection(stored.items, text_lookup)
             if sanitized_items != stored.items:
@@ -115,7 +113,7 @@ class ExtractionRunManager:
 
         cached = await self.get_cached(case_id, documents)
         if cached is not None:
-            return _copy_collection(cached)
+            return cached
 
         case_key = str(case_id)
         async with self._lock:
@@ -133,10 +131,11 @@ class ExtractionRunManager:
                     if current is task:
                         self._in_flight.pop(case_key, None)
 
+        # Concurrent callers await the same task, so each gets its own copy of the shared result.
         return _copy_collection(result)
 
     async def _run_extraction(self, case_id: str, documents: List[DocumentReference]) -> EvidenceCollection:
-        sorted_docs = sorted(documents, key=_document_sort_key)
+        sorted_docs = sorted(documents, key=DOCUMENT_SORT_KEY)
         text_lookup = _build_text_lookup_from_references(case_id, sorted_docs)
 
         stored = self._store.get(case_id)
@@ -148,10 +147,9 @@ class ExtractionRunManager:
                     items=sanitized_items,
                     version=stored.version,
                 )
-            return _copy_collection(sanitized_items)
+            return sanitized_items
 
-        result = await _run_extraction(case_id, sorted_docs, text_lookup)
-        return _copy_collection(result)
+        return await _run_extraction(case_id, sorted_docs, text_lookup)
 
 
 _EXTRACTION_RUN_MANAGER = ExtractionRunManager(_DOCUMENT_CHECKLIST_STORE)
@@ -187,24 +185,6 @@ def get_category_metadata(include_members: bool = False) -> List[Dict[str, objec
     return metadata
 
 
-def _parse_date(value: Optional[str]) -> Optional[datetime]:
-    if not value:
-        return None
-    try:
-        return datetime.fromisoformat(value)
-    except ValueError:
-        return None
-
-
-def _document_sort_key(doc_ref: DocumentReference) -> tuple:
-    if doc_ref.is_docket:
-        return (0, doc_ref.id)
-    date_value = _parse_date(doc_ref.date)
-    if date_value is None:
-        return (1, 1, 0, doc_ref.id)
-    return (1, 0, -date_value.timestamp(), doc_ref.id)
-
-
 def _resolve_document_payloads(case_id: str, documents: List[DocumentReference]) -> List[Dict[str, str]]:
     payloads: List[Dict[str, str]] = []
     for doc_ref in documents:
@@ -346,7 +326,7 @@ async def _run_extraction(
 
         sanitized_items = _strip_sentence_ids_from_collection(result, text_lookup)
         _DOCUMENT_CHECKLIST_STORE.set(case_id, items=sanitized_items, version=_CHECKLIST_VERSION)
-        return _copy_collection(sanitized_items)
+        return sanitized_items
 
     except Exception as exc:
         producer.error("Agent extraction failed", {"case_id": case_id, "error": str(exc)})
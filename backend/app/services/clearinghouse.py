@@ -2,6 +2,7 @@ from __future__ import annotations
 
 import json
 import time
+from concurrent.futures import ThreadPoolExecutor
 from typing import Any, Dict, Iterable, List, Optional
 
 import httpx
@@ -14,6 +15,7 @@ producer = get_event_producer(__name__)
 _INLINE_PAYLOAD_LIMIT = 10_000
 _PAYLOAD_PREVIEW_LIMIT = 4_000
 _BODY_PREVIEW_LIMIT = 2_000
+_TEXT_FETCH_WORKERS = 8
 
 
 def _safe_json_dump(payload: Any) -> str:
@@ -100,6 +102,7 @@ class ClearinghouseClient:
 
         documents_payload = self._fetch_all_pages(case_documents_url)
         dockets_payload = self._fetch_all_pages(case_dockets_url)
+        self._prefetch_full_text(documents_payload)
 
         documents: List[Document] = []
         for raw_doc in documents_payload:
@@ -255,6 +258,23 @@ class ClearinghouseClient:
             next_url = payload.get("next") if isinstance(payload, dict) else None
         return results
 
+    def _prefetch_full_text(self, raw_documents: List[Dict[str, Any]]) -> None:
+        """Fill in missing document text, fetching the text URLs concurrently."""
+        pending = [raw for raw in raw_documents if not raw.get("text") and raw.get("text_url")]
+        if not pending:
+            return
+        for raw in pending:
+            producer.info(
+                "Fetching full text for document",
+                {"document_id": raw.get("id") or raw.get("document_id"), "url": raw["text_url"]},
+            )
+        # httpx releases the GIL while waiting on the network, so threads overlap the round-trips.
+        with ThreadPoolExecutor(max_workers=min(_TEXT_FETCH_WORKERS, len(pending))) as executor:
+            texts = list(executor.map(self._fetch_full_text, [raw["text_url"] for raw in pending]))
+        for raw, text in zip(pending, texts):
+            if text:
+                raw["text"] = text
+
     def _fetch_full_text(self, url: str) -> Optional[str]:
         """Fetch full text from the dedicated text URL."""
         if not url:
@@ -294,17 +314,6 @@ class ClearinghouseClient:
         )
         doc_type = doc_type.replace("_", " ").strip().title()
 
-        # Check if we need to fetch text separately
-        text_url = raw.get("text_url")
-        if not raw.get("text") and text_url:
-            producer.info(
-                "Fetching full text for document",
-                {"document_id": document_id, "url": text_url},
-            )
-            fetched_text = self._fetch_full_text(text_url)
-            if fetched_text:
-                raw["text"] = fetched_text
-
         content = _render_document_content(raw)
 
         return Document(
@@ -1,30 +1,51 @@
 from __future__ import annotations
 
-from datetime import datetime
+import queue
+import threading
+from collections import OrderedDict
 from functools import lru_cache
-from typing import Any, Dict, Iterable, List, Optional
+from typing import Any, Dict, Iterable, List, Optional, Tuple
 
 from fastapi import HTTPException
+from pydantic import TypeAdapter
 
 from app.core.config import get_settings
 from app.data.case_document_store import CaseDocumentStore, SqlCaseDocumentStore
 from app.eventing import get_event_producer
-from app.schemas.documents import Document, DocumentMetadata
+from app.schemas.documents import DOCUMENT_SORT_KEY, Document, DocumentMetadata
 from app.services.clearinghouse import (
     ClearinghouseClient,
     ClearinghouseError,
     ClearinghouseNotConfigured,
     ClearinghouseNotFound,
 )
+from app.utils.case_ids import normalize_case_id
 
 producer = get_event_producer(__name__)
 
 _settings = get_settings()
 _CASE_STORE: CaseDocumentStore = SqlCaseDocumentStore()
+_DOCUMENT_LIST_ADAPTER = TypeAdapter(List[Document])
+
+# In-process LRU view of the case store, capped at _MAX_CACHED_CASES since each entry holds
+# a case's full document text. The lock guards recency updates and keeps a case's documents
+# and title published and evicted together; evicted cases reload from _CASE_STORE.
+_MAX_CACHED_CASES = 64
+_CASE_CACHE: "OrderedDict[str, List[Document]]" = OrderedDict()
+_CASE_TITLE_CACHE: Dict[str, str] = {}
+_CASE_CACHE_LOCK = threading.Lock()
+
+# Write-behind persistence: request handlers publish to _CASE_CACHE and enqueue the
+# case id; a daemon thread writes the latest snapshot per case to _CASE_STORE.
+# A None entry tells the worker to stop once everything queued before it is written.
+_PERSIST_QUEUE: "queue.Queue[Optional[str]]" = queue.Queue()
+_PENDING_WRITES: Dict[str, Tuple[List[Document], str]] = {}
+_PENDING_WRITES_LOCK = threading.Lock()
+_persist_worker: Optional[threading.Thread] = None
 
 
 def list_documents(case_id: str) -> List[Document]:
-    normalized = _normalize_case_id(case_id)
+    normalized = normalize_case_id(case_id)
 
     cached = _get_stored_documents(normalized)
     if cached is not None:
@@ -61,12 +82,12 @@ def list_documents(case_id: str) -> List[Document]:
 
     ordered = _sort_documents(documents)
     _remember_documents(normalized, ordered, case_title)
-    return _clone_documents(ordered)
+    return list(ordered)
 
 
 def list_cached_documents(case_id: str) -> List[Document]:
     """Return cached/stored documents for a case without hitting external sources."""
-    normalized = _normalize_case_id(case_id)
+    normalized = normalize_case_id(case_id)
     cached = _get_stored_documents(normalized)
     if cached is not None:
         return _sort_documents(cached)
@@ -74,7 +95,7 @@ def list_cached_documents(case_id: str) -> List[Document]:
 
 
 def get_document(case_id: str, document_id: str) -> Document:
-    normalized = _normalize_case_id(case_id)
+    normalized = normalize_case_id(case_id)
     documents = _get_stored_documents(normalized)
     if documents is None:
         documents = list_documents(normalized)
@@ -85,7 +106,7 @@ def get_document(case_id: str, document_id: str) -> Document:
 
 
 def get_document_metadata(case_id: str) -> List[DocumentMetadata]:
-    normalized = _normalize_case_id(case_id)
+    normalized = normalize_case_id(case_id)
     documents = _get_stored_documents(normalized)
     if documents is None:
         documents = list_documents(normalized)
@@ -103,12 +124,11 @@ def get_document_metadata(case_id: str) -> List[DocumentMetadata]:
 
 def get_case_title(case_id: str) -> Optional[str]:
     """Return the cached case title if available."""
-    normalized = _normalize_case_id(case_id)
-    stored = _CASE_STORE.get(normalized)
-    if stored is None:
-        return None
-
-    return stored.case_title
+    normalized = normalize_case_id(case_id)
+    title = _CASE_TITLE_CACHE.get(normalized)
+    if title is None and _get_stored_documents(normalized) is not None:
+        title = _CASE_TITLE_CACHE.get(normalized)
+    return title
 
 
 def _require_case_title(source: Optional[str], documents: Iterable[Document]) -> str:
@@ -137,14 +157,88 @@ def _get_clearinghouse_client() -> ClearinghouseClient:
     return ClearinghouseClient(api_key=api_key)
 
 
-def _remember_documents(case_id: str, documents: Iterable[Document], case_title: str) -> None:
+def _cache_documents(case_id: str, documents: List[Document], case_title: str) -> None:
+    with _CASE_CACHE_LOCK:
+        _CASE_CACHE[case_id] = documents
+        _CASE_CACHE.move_to_end(case_id)
+        _CASE_TITLE_CACHE[case_id] = case_title
+        while len(_CASE_CACHE) > _MAX_CACHED_CASES:
+            evicted, _ = _CASE_CACHE.popitem(last=False)
+            _CASE_TITLE_CACHE.pop(evicted, None)
+
+
+def _get_cached_documents(case_id: str) -> Optional[List[Document]]:
+    with _CASE_CACHE_LOCK:
+        documents = _CASE_CACHE.get(case_id)
+        if documents is not None:
+            _CASE_CACHE.move_to_end(case_id)
+    return documents
+
+
+def _remember_documents(case_id: str, documents: List[Document], case_title: str) -> None:
+    _cache_documents(case_id, documents, case_title)
+    _schedule_persist(case_id, documents, case_title)
+
+
+def _schedule_persist(case_id: str, documents: List[Document], case_title: str) -> None:
+    global _persist_worker
+    with _PENDING_WRITES_LOCK:
+        # Coalesce: a case already waiting in the queue just picks up the newer snapshot.
+        already_queued = case_id in _PENDING_WRITES
+        _PENDING_WRITES[case_id] = (documents, case_title)
+        if _persist_worker is None or not _persist_worker.is_alive():
+            _persist_worker = threading.Thread(
+                target=_run_persist_worker, name="case-document-writer", daemon=True
+            )
+            _persist_worker.start()
+    if not already_queued:
+        _PERSIST_QUEUE.put(case_id)
+
+
+def flush_pending_writes() -> None:
+    """Stop the persist worker after it has written every queued case, then write any stragglers."""
+    global _persist_worker
+    with _PENDING_WRITES_LOCK:
+        worker = _persist_worker
+        if worker is not None and worker.is_alive():
+            _PERSIST_QUEUE.put(None)
+    if worker is not None:
+        worker.join()
+    with _PENDING_WRITES_LOCK:
+        if _persist_worker is worker:
+            _persist_worker = None
+        # Cases scheduled while the worker was stopping never reach it; write them here.
+        leftover = list(_PENDING_WRITES.items())
+        _PENDING_WRITES.clear()
+    for case_id, (documents, case_title) in leftover:
+        _persist_documents(case_id, documents, case_title)
+
+
+def _run_persist_worker() -> None:
+    while True:
+        case_id = _PERSIST_QUEUE.get()
+        if case_id is None:
+            return
+        with _PENDING_WRITES_LOCK:
+            pending = _PENDING_WRITES.pop(case_id, None)
+        if pending is None:
+            continue
+        documents, case_title = pending
+        _persist_documents(case_id, documents, case_title)
+
+
+def _persist_documents(case_id: str, documents: List[Document], case_title: str) -> None:
     try:
-        _CASE_STORE.set(case_id, [doc.model_dump(mode="json") for doc in documents], case_title)
-    except Exception:  # pylint: disable=broad-except
-        producer.error("Failed to persist documents", {"case_id": case_id})
+        _CASE_STORE.set(case_id, _DOCUMENT_LIST_ADAPTER.dump_python(documents), case_title)
+    except Exception as exc:  # pylint: disable=broad-except
+        producer.error("Failed to persist documents", {"case_id": case_id, "error": str(exc)})
 
 
 def _get_stored_documents(case_id: str) -> Optional[List[Document]]:
+    cached = _get_cached_documents(case_id)
+    if cached is not None:
+        return list(cached)
+
     stored = _CASE_STORE.get(case_id)
     if stored is None:
         return None
@@ -167,37 +261,10 @@ def _get_stored_documents(case_id: str) -> Optional[List[Document]]:
             item = working
         documents.append(Document.model_validate(item))
     ordered = _sort_documents(documents)
-    return _clone_documents(ordered)
-
-
-def _clone_documents(documents: Iterable[Document]) -> List[Document]:
-    return [Document.model_validate(doc.model_dump(mode="python")) for doc in documents]
-
-
-def _normalize_case_id(case_id: str) -> str:
-    try:
-        return str(int(case_id))
-    except (TypeError, ValueError):
-        return str(case_id)
-
-
-def _parse_date(value: Optional[str]) -> Optional[datetime]:
-    if not value:
-        return None
-    try:
-        return datetime.fromisoformat(value)
-    except ValueError:
-        return None
-
+    _cache_documents(case_id, ordered, stored.case_title)
+    return list(ordered)
 
-def _document_sort_key(document: Document) -> tuple:
-    if document.is_docket:
-        return (0, document.id)
-    date_value = _parse_date(document.date)
-    if date_value is None:
-        return (1, 1, 0, document.id)
-    return (1, 0, -date_value.timestamp(), document.id)
 
 
 def _sort_documents(documents: List[Document]) -> List[Document]:
-    return sorted(list(documents), key=_document_sort_key)
+    return sorted(documents, key=DOCUMENT_SORT_KEY)
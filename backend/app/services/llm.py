@@ -1,31 +1,41 @@
 from __future__ import annotations
 
 import asyncio
+import contextlib
 import json
 import re
 from dataclasses import dataclass, field
-from typing import Any, Awaitable, Callable, Dict, List, Optional
+from functools import lru_cache
+from typing import Any, AsyncIterator, Awaitable, Callable, Dict, List, Optional
 
 import httpx
-from openai import AsyncOpenAI
+import orjson
+from openai import AsyncOpenAI, DefaultAsyncHttpxClient
 from pydantic import BaseModel, ValidationError
 
-from app.core.config import Settings, get_settings
+from app.core.config import HttpPoolConfig, Settings, get_settings
 from app.eventing import EventVisibility, get_event_producer
 
 producer = get_event_producer(__name__)
 
+_JSON_HEADERS = {"Content-Type": "application/json"}
+_TOOLS_CACHE_SIZE = 32
 
-@dataclass
+
+@dataclass(slots=True, frozen=True)
 class LLMMessage:
     role: str
     content: str
 
+    def as_dict(self) -> Dict[str, str]:
+        return {"role": self.role, "content": self.content}
 
-@dataclass
+
+@dataclass(slots=True, frozen=True)
 class LLMResult:
     text: str
-    raw: Dict[str, Any] | None = None
+    # Provider payload for debug logging: a dict, or the SDK model (dumped only when logged).
+    raw: Dict[str, Any] | BaseModel | None = None
     tool_outputs: List["LLMToolHandlerResult"] = field(default_factory=list)
     tool_calls: List["LLMToolCall"] = field(default_factory=list)
 
@@ -44,15 +54,107 @@ class LLMToolHandlerResult:
     metadata: Dict[str, Any] | None = None
 
 
+_THINK_RE = re.compile(r"<think>.*?</think>\n?", re.DOTALL)
+
+
 def _strip_reasoning_tokens(text: str) -> str:
-    return re.sub(r"<think>.*?</think>\n?", "", text, flags=re.DOTALL)
+    if "<think>" not in text:
+        return text
+    return _THINK_RE.sub("", text)
+
+
+def _partial_tag_length(text: str, tag: str) -> int:
+    """Length of the longest suffix of text that is a proper prefix of tag."""
+    for size in range(min(len(tag) - 1, len(text)), 0, -1):
+        if text.endswith(tag[:size]):
+            return size
+    return 0
+
+
+async def _strip_reasoning_stream(chunks: AsyncIterator[str]) -> AsyncIterator[str]:
+    """Streaming counterpart of _strip_reasoning_tokens.
+
+    The joined output equals _strip_reasoning_tokens of the joined input for any chunking,
+    including tags split across chunks and an unterminated <think> tail, which is kept.
+    """
+    buffer = ""
+    in_think = False
+    # While in_think, buffer starts with "<think>" and no "</think>" starts before this offset.
+    scanned = 0
+    drop_newline = False
+    async with contextlib.aclosing(chunks):
+        async for chunk in chunks:
+            buffer += chunk
+            emitted: List[str] = []
+            while buffer:
+                if drop_newline:
+                    buffer = buffer.removeprefix("\n")
+                    drop_newline = False
+                elif in_think:
+                    end = buffer.find("</think>", scanned)
+                    if end == -1:
+                        scanned = max(scanned, len(buffer) - len("</think>") + 1)
+                        break
+                    buffer = buffer[end + len("</think>"):]
+                    in_think = False
+                    drop_newline = True
+                else:
+                    start = buffer.find("<think>")
+                    if start == -1:
+                        keep = _partial_tag_length(buffer, "<think>")
+                        emitted.append(buffer[: len(buffer) - keep])
+                        buffer = buffer[len(buffer) - keep:]
+                        break
+                    emitted.append(buffer[:start])
+                    buffer = buffer[start:]
+                    in_think = True
+                    scanned = len("<think>")
+            text = "".join(emitted)
+            if text:
+                yield text
+    if buffer:
+        yield buffer
+
 
+def _http_limits(pool: HttpPoolConfig) -> httpx.Limits:
+    # Keep idle connections around between calls so multi-step agent loops reuse
+    # established (TLS) connections instead of reconnecting after httpx's 5s default.
+    return httpx.Limits(
+        max_connections=pool.max_connections,
+        max_keepalive_connections=pool.max_keepalive_connections,
+        keepalive_expiry=pool.keepalive_expiry_seconds,
+    )
 
+
+@lru_cache(maxsize=256)
 def _schema_from_model(model: type[BaseModel]) -> str:
     schema = model.model_json_schema(by_alias=True)
     return json.dumps(schema, indent=2, sort_keys=True)
 
 
+@lru_cache(maxsize=64)
+def _ollama_structured_prefix(schema: str) -> str:
+    return (
+        "Return only valid JSON conforming to this schema definition:\n"
+        f"{schema}\n\n"
+        "Respond with JSON only, no natural language commentary.\n\n"
+    )
+
+
+@lru_cache(maxsize=128)
+def _openai_structured_system(schema: str, system: Optional[str]) -> str:
+    structured_instructions = (
+        "Return a JSON object that satisfies this schema description. "
+        "Do not include any additional commentary.\n"
+        f"{schema}"
+    )
+    return structured_instructions if system is None else f"{structured_instructions}\n\n{system}"
+
+
+class OllamaStreamError(RuntimeError):
+    """Raised when a streamed Ollama response reports an error or ends before its done chunk."""
+
+
 class LLMBackend:
     async def generate_response(
         self,
@@ -81,6 +183,16 @@ class LLMBackend:
     ) -> LLMResult:
         raise NotImplementedError
 
+    async def stream_response(
+        self,
+        prompt: str,
+        *,
+        system: Optional[str] = None,
+    ) -> AsyncIterator[str]:
+        result = await self.generate_response(prompt, system=system)
+        if result.text:
+            yield result.text
+
     async def chat_with_tools(
         self,
         messages: List[LLMMessage],
@@ -101,24 +213,85 @@ class OllamaBackend(LLMBackend):
         if not config:
             raise RuntimeError("Ollama configuration is missing")
         self._defaults = settings.model.defaults
+        # Sampling options never change after startup; payloads share this dict read-only.
+        self._options: Dict[str, Any] = {
+            "temperature": self._defaults.temperature,
+            "num_predict": self._defaults.max_output_tokens,
+            "num_ctx": 32768,
+        }
         timeout = httpx.Timeout(config.timeout_seconds)
-        self._client = httpx.AsyncClient(base_url=config.base_url, timeout=timeout)
-        self._lock = asyncio.Lock()
+        self._client = httpx.AsyncClient(
+            base_url=config.base_url,
+            timeout=timeout,
+            limits=_http_limits(config.http_pool),
+        )
+        # httpx.AsyncClient is safe for concurrent use; only cap in-flight requests when configured.
+        self._semaphore = asyncio.Semaphore(config.max_concurrency) if config.max_concurrency else None
         self._response_model = config.response_model
         self._conversation_model = config.conversation_model_name()
+        self._keep_alive = config.keep_alive
 
-    async def _post(self, path: str, payload: Dict[str, Any]) -> Dict[str, Any]:
-        async with self._lock:
-            response = await self._client.post(path, json=payload)
-            response.raise_for_status()
-        return response.json()
+    def _request_slot(self) -> contextlib.AbstractAsyncContextManager:
+        return self._semaphore if self._semaphore is not None else contextlib.nullcontext()
 
-    def _build_options(self) -> Dict[str, Any]:
-        return {
-            "temperature": self._defaults.temperature,
-            "num_predict": self._defaults.max_output_tokens,
-            "num_ctx": 32768,
-        }
+    def _encode(self, payload: Dict[str, Any], **overrides: Any) -> bytes:
+        if self._keep_alive is not None:
+            overrides.setdefault("keep_alive", self._keep_alive)
+        return orjson.dumps({**payload, **overrides} if overrides else payload)
+
+    async def _post(self, path: str, payload: Dict[str, Any]) -> Dict[str, Any]:
+        async with self._request_slot():
+            response = await self._client.post(path, content=self._encode(payload), headers=_JSON_HEADERS)
+        response.raise_for_status()
+        return orjson.loads(response.content)
+
+    async def _stream(self, path: str, payload: Dict[str, Any]) -> AsyncIterator[Dict[str, Any]]:
+        """Yield the NDJSON chunks of a streaming Ollama request as they arrive.
+
+        The request slot is held until the generator finishes or is closed, so consumers
+        that may stop early must close it (contextlib.aclosing) rather than abandon it.
+        """
+        async with self._request_slot():
+            body = self._encode(payload, stream=True)
+            async with self._client.stream("POST", path, content=body, headers=_JSON_HEADERS) as response:
+                response.raise_for_status()
+                async for line in response.aiter_lines():
+                    if not line:
+                        continue
+                    chunk = orjson.loads(line)
+                    error = chunk.get("error")
+                    if error:
+                        raise OllamaStreamError(f"Ollama {path} stream failed: {error}")
+                    yield chunk
+                    if chunk.get("done"):
+                        return
+        raise OllamaStreamError(f"Ollama {path} stream ended before a done chunk")
+
+    async def _collect(self, payload: Dict[str, Any], *, chat: bool) -> Dict[str, Any]:
+        """Run a streaming request and fold its chunks into the non-streaming response shape."""
+        parts: List[str] = []
+        tool_calls: List[Dict[str, Any]] = []
+        final: Dict[str, Any] = {}
+        chunks = self._stream("/api/chat" if chat else "/api/generate", payload)
+        async with contextlib.aclosing(chunks):
+            async for chunk in chunks:
+                message = chunk.get("message")
+                if isinstance(message, dict):
+                    parts.append(message.get("content") or "")
+                    tool_calls.extend(message.get("tool_calls") or [])
+                else:
+                    parts.append(chunk.get("response") or "")
+                final = chunk
+        collected = dict(final)
+        text = "".join(parts)
+        if chat:
+            message_block: Dict[str, Any] = {"role": "assistant", "content": text}
+            if tool_calls:
+                message_block["tool_calls"] = tool_calls
+            collected["message"] = message_block
+        else:
+            collected["response"] = text
+        return collected
 
     async def generate_response(
         self,
@@ -126,17 +299,38 @@ class OllamaBackend(LLMBackend):
         *,
         system: Optional[str] = None,
     ) -> LLMResult:
+        raw_response = await self._collect(self._generate_payload(prompt, system=system), chat=False)
+        text = _strip_reasoning_tokens(raw_response.get("response") or "").strip()
+        return LLMResult(text=text, raw=raw_response)
+
+    async def stream_response(
+        self,
+        prompt: str,
+        *,
+        system: Optional[str] = None,
+    ) -> AsyncIterator[str]:
+        async def deltas() -> AsyncIterator[str]:
+            chunks = self._stream("/api/generate", self._generate_payload(prompt, system=system))
+            async with contextlib.aclosing(chunks):
+                async for chunk in chunks:
+                    text = chunk.get("response")
+                    if text:
+                        yield text
+
+        async with contextlib.aclosing(_strip_reasoning_stream(deltas())) as texts:
+            async for text in texts:
+                yield text
+
+    def _generate_payload(self, prompt: str, *, system: Optional[str]) -> Dict[str, Any]:
         payload: Dict[str, Any] = {
             "model": self._response_model,
             "prompt": prompt,
-            "stream": False,
-            "options": self._build_options(),
+            "stream": True,
+            "options": self._options,
         }
         if system:
             payload["system"] = system
-        raw_response = await self._post("/api/generate", payload)
-        text = _strip_reasoning_tokens(raw_response.get("response", "").strip())
-        return LLMResult(text=text, raw=raw_response)
+        return payload
 
     async def generate_structured(
         self,
@@ -146,24 +340,19 @@ class OllamaBackend(LLMBackend):
         schema: str,
         system: Optional[str] = None,
     ) -> BaseModel:
-        json_prompt = (
-            "Return only valid JSON conforming to this schema definition:\n"
-            f"{schema}\n\n"
-            "Respond with JSON only, no natural language commentary.\n\n"
-            f"{prompt}"
-        )
+        json_prompt = _ollama_structured_prefix(schema) + prompt
         payload: Dict[str, Any] = {
             "model": self._response_model,
             "prompt": json_prompt,
             "stream": False,
             "format": "json",
-            "options": self._build_options(),
+            "options": self._options,
         }
         if system:
             payload["system"] = system
 
         raw_response = await self._post("/api/generate", payload)
-        text = _strip_reasoning_tokens(raw_response.get("response", "").strip())
+        text = _strip_reasoning_tokens(raw_response.get("response") or "").strip()
         result = LLMResult(text=text, raw=raw_response)
         try:
             return response_model.model_validate_json(result.text)
@@ -178,22 +367,21 @@ class OllamaBackend(LLMBackend):
         system: Optional[str] = None,
         tools: Optional[List[Dict[str, Any]]] = None,
     ) -> LLMResult:
-        payload_messages: List[Dict[str, str]] = []
+        payload_messages: List[Dict[str, str]] = [message.as_dict() for message in messages]
         if system:
-            payload_messages.append({"role": "system", "content": system})
-        payload_messages.extend({"role": message.role, "content": message.content} for message in messages)
+            payload_messages.insert(0, {"role": "system", "content": system})
 
         payload: Dict[str, Any] = {
             "model": self._conversation_model,
             "messages": payload_messages,
-            "stream": False,
-            "options": self._build_options(),
+            "stream": True,
+            "options": self._options,
         }
 
         if tools:
             payload["tools"] = tools
 
-        raw_response = await self._post("/api/chat", payload)
+        raw_response = await self._collect(payload, chat=True)
         message_block = raw_response.get("message") or {}
         
         tool_calls = message_block.get("tool_calls")
@@ -205,7 +393,7 @@ class OllamaBackend(LLMBackend):
                 llm_tool_calls.append(
                     LLMToolCall(
                         name=func.get("name", ""),
-                        arguments=json.dumps(func.get("arguments", {})),
+                        arguments=orjson.dumps(func.get("arguments", {})).decode("utf-8"),
                         call_id="" # Ollama might not return call_id
                     )
                 )
@@ -218,7 +406,7 @@ class OllamaBackend(LLMBackend):
         else:
             text = raw_response.get("response", "")
         
-        cleaned = _strip_reasoning_tokens(text.strip()) if text else ""
+        cleaned = _strip_reasoning_tokens(text).strip() if text else ""
         
         return LLMResult(
             text=cleaned, 
@@ -240,12 +428,29 @@ class OpenAIBackend(LLMBackend):
         if not api_key:
             raise RuntimeError("OpenAI API key is not configured")
         self._defaults = settings.model.defaults
-        self._client = AsyncOpenAI(api_key=api_key)
+        self._client = AsyncOpenAI(
+            api_key=api_key,
+            http_client=DefaultAsyncHttpxClient(limits=_http_limits(config.http_pool)),
+        )
         self._response_model = config.response_model
         self._conversation_model = config.conversation_model_name()
         self._reasoning_effort = config.reasoning_effort
+        self._tools_cache: Dict[int, tuple[List[Dict[str, Any]], List[Dict[str, Any]]]] = {}
 
     def _normalize_openai_tools(self, tools: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+        # Callers such as the summary chat pass the same module-level tool list on every request.
+        # Entries hold the list itself, so a recycled id() can never match a different list.
+        cached = self._tools_cache.get(id(tools))
+        if cached is not None and cached[0] is tools:
+            return cached[1]
+        normalized = self._convert_openai_tools(tools)
+        if len(self._tools_cache) >= _TOOLS_CACHE_SIZE:
+            self._tools_cache.clear()
+        self._tools_cache[id(tools)] = (tools, normalized)
+        return normalized
+
+    @staticmethod
+    def _convert_openai_tools(tools: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
         normalized: List[Dict[str, Any]] = []
         for tool in tools:
             if tool.get("type") == "function" and isinstance(tool.get("function"), dict):
@@ -276,16 +481,32 @@ class OpenAIBackend(LLMBackend):
         *,
         system: Optional[str] = None,
     ) -> LLMResult:
-        response = await self._client.responses.create(
-            model=self._response_model,
-            input=self._build_input(prompt, system=system),
-            max_output_tokens=self._defaults.max_output_tokens,
-            reasoning={
+        # Not streamed: get_final_response() raises on response.incomplete (e.g. max_output_tokens),
+        # whereas create() returns the partial response with status="incomplete".
+        response = await self._client.responses.create(**self._text_request(prompt, system=system))
+        text = _collect_openai_text(response).strip()
+        return LLMResult(text=text, raw=response)
+
+    async def stream_response(
+        self,
+        prompt: str,
+        *,
+        system: Optional[str] = None,
+    ) -> AsyncIterator[str]:
+        async with self._client.responses.stream(**self._text_request(prompt, system=system)) as stream:
+            async for event in stream:
+                if event.type == "response.output_text.delta" and event.delta:
+                    yield event.delta
+
+    def _text_request(self, prompt: str, *, system: Optional[str]) -> Dict[str, Any]:
+        return {
+            "model": self._response_model,
+            "input": self._build_input(prompt, system=system),
+            "max_output_tokens": self._defaults.max_output_tokens,
+            "reasoning": {
                 "effort": self._reasoning_effort,
-            }
-        )
-        text = _strip_reasoning_tokens(_collect_openai_text(response))
-        return LLMResult(text=text.strip(), raw=response.model_dump())
+            },
+        }
 
     async def generate_structured(
         self,
@@ -295,12 +516,7 @@ class OpenAIBackend(LLMBackend):
         schema: str,
         system: Optional[str] = None,
     ) -> BaseModel:
-        structured_instructions = (
-            "Return a JSON object that satisfies this schema description. "
-            "Do not include any additional commentary.\n"
-            f"{schema}"
-        )
-        combined_system = structured_instructions if system is None else f"{structured_instructions}\n\n{system}"
+        combined_system = _openai_structured_system(schema, system)
         response = await self._client.responses.parse(
             model=self._response_model,
             input=[
@@ -316,23 +532,19 @@ class OpenAIBackend(LLMBackend):
             },
             text_format=response_model,
         )
-        producer.debug(
-            "OpenAI structured response",
-            {
-                "operation": "openai.generate_structured.response",
-                "response": response.model_dump(),
-            },
-        )
+        if producer.is_enabled(EventVisibility.DEBUG):
+            producer.debug(
+                "OpenAI structured response",
+                {
+                    "operation": "openai.generate_structured.response",
+                    "response": response.model_dump(mode="json", exclude_none=True),
+                },
+            )
         parsed = getattr(response, "output_parsed", None)
         if parsed is None:
             producer.warning("OpenAI structured output missing parsed payload")
             raise ValueError("Structured output did not produce parsed content")
-        if not isinstance(parsed, response_model):
-            try:
-                return response_model.model_validate(parsed)
-            except ValidationError as exc:
-                producer.warning("OpenAI structured output validation failed", {"error": str(exc)})
-                raise
+        # responses.parse(text_format=response_model) already returns a validated instance.
         return parsed
 
     async def chat(
@@ -342,10 +554,9 @@ class OpenAIBackend(LLMBackend):
         system: Optional[str] = None,
         tools: Optional[List[Dict[str, Any]]] = None,
     ) -> LLMResult:
-        input_messages: List[Dict[str, str]] = []
+        input_messages: List[Dict[str, str]] = [message.as_dict() for message in messages]
         if system:
-            input_messages.append({"role": "system", "content": system})
-        input_messages.extend({"role": message.role, "content": message.content} for message in messages)
+            input_messages.insert(0, {"role": "system", "content": system})
 
         kwargs = {
             "model": self._conversation_model,
@@ -363,7 +574,7 @@ class OpenAIBackend(LLMBackend):
 
         response = await self._client.responses.create(**kwargs)
         
-        text = _strip_reasoning_tokens(_collect_openai_text(response)).strip()
+        text = _collect_openai_text(response).strip()
         
         llm_tool_calls = []
         output = getattr(response, "output", None) or []
@@ -377,7 +588,7 @@ class OpenAIBackend(LLMBackend):
                      )
                  )
         
-        return LLMResult(text=text, raw=response.model_dump(), tool_calls=llm_tool_calls)
+        return LLMResult(text=text, raw=response, tool_calls=llm_tool_calls)
 
     async def chat_with_tools(
         self,
@@ -390,17 +601,18 @@ class OpenAIBackend(LLMBackend):
         if not tools or tool_handler is None:
             return await self.chat(messages, system=system)
 
-        conversation: List[Any] = []
+        conversation: List[Any] = [message.as_dict() for message in messages]
         if system:
-            conversation.append({"role": "system", "content": system})
-        conversation.extend({"role": message.role, "content": message.content} for message in messages)
+            conversation.insert(0, {"role": "system", "content": system})
 
         handler_results: List[LLMToolHandlerResult] = []
+        # The tool list is fixed for the whole loop; normalise it once.
+        normalized_tools = self._normalize_openai_tools(tools)
 
         response = await self._client.responses.create(
             model=self._conversation_model,
             input=conversation,
-            tools=self._normalize_openai_tools(tools),
+            tools=normalized_tools,
             max_output_tokens=self._defaults.max_output_tokens,
             reasoning={
                 "effort": self._reasoning_effort,
@@ -417,12 +629,17 @@ class OpenAIBackend(LLMBackend):
                 if getattr(item, "type", None) == "function_call"
             ]
             if not tool_calls:
-                text = _strip_reasoning_tokens(_collect_openai_text(response)).strip()
-                return LLMResult(text=text, raw=response.model_dump(), tool_outputs=handler_results)
-
-            for call in tool_calls:
-                llm_call = LLMToolCall(name=call.name, arguments=call.arguments, call_id=call.call_id)
-                handler_result = await tool_handler(llm_call)
+                text = _collect_openai_text(response).strip()
+                return LLMResult(text=text, raw=response, tool_outputs=handler_results)
+
+            # Handlers run concurrently; results are folded back in call order.
+            round_results = await asyncio.gather(
+                *(
+                    tool_handler(LLMToolCall(name=call.name, arguments=call.arguments, call_id=call.call_id))
+                    for call in tool_calls
+                )
+            )
+            for call, handler_result in zip(tool_calls, round_results):
                 output_payload = handler_result.output or "{}"
                 handler_result.output = output_payload
                 handler_results.append(handler_result)
@@ -437,7 +654,7 @@ class OpenAIBackend(LLMBackend):
             response = await self._client.responses.create(
                 model=self._conversation_model,
                 input=conversation,
-                tools=self._normalize_openai_tools(tools),
+                tools=normalized_tools,
                 max_output_tokens=self._defaults.max_output_tokens,
                 reasoning={
                     "effort": self._reasoning_effort,
@@ -448,9 +665,17 @@ class OpenAIBackend(LLMBackend):
             conversation.extend(response.output or [])
 
     async def aclose(self) -> None:
+        self._tools_cache.clear()
         await self._client.close()
 
 
+_MOCK_STRUCTURED_PAYLOADS: Dict[str, Dict[str, Any]] = {
+    "ChecklistExtractionPayload": {"reasoning": "Mock reasoning", "extracted": []},
+    "SummaryChecklistExtractionPayload": {"items": []},
+}
+_MOCK_STRUCTURED_CACHE: Dict[type[BaseModel], BaseModel] = {}
+
+
 class MockBackend(LLMBackend):
     async def generate_response(
         self,
@@ -474,15 +699,16 @@ class MockBackend(LLMBackend):
         schema: str,
         system: Optional[str] = None,
     ) -> BaseModel:
-        if response_model.__name__ == "ChecklistExtractionPayload":
-            payload = {"reasoning": "Mock reasoning", "extracted": []}
-            return response_model.model_validate(payload)
-        if response_model.__name__ == "SummaryChecklistExtractionPayload":
-            return response_model.model_validate({"items": []})
-        try:
-            return response_model.model_validate({})
-        except ValidationError as exc:
-            raise RuntimeError(f"Mock backend cannot satisfy response model {response_model.__name__}") from exc
+        cached = _MOCK_STRUCTURED_CACHE.get(response_model)
+        if cached is None:
+            payload = _MOCK_STRUCTURED_PAYLOADS.get(response_model.__name__, {})
+            try:
+                cached = response_model.model_validate(payload)
+            except ValidationError as exc:
+                raise RuntimeError(f"Mock backend cannot satisfy response model {response_model.__name__}") from exc
+            _MOCK_STRUCTURED_CACHE[response_model] = cached
+        # Callers may mutate the result, so hand out copies of the validated instance.
+        return cached.model_copy(deep=True)
 
     async def chat(
         self,
@@ -490,7 +716,12 @@ class MockBackend(LLMBackend):
         *,
         system: Optional[str] = None,
     ) -> LLMResult:
-        last_user = next((message for message in reversed(messages) if message.role == "user"), None)
+        last_user: Optional[LLMMessage] = None
+        # Conversations almost always end on a user turn; otherwise scan back by index.
+        for index in range(len(messages) - 1, -1, -1):
+            if messages[index].role == "user":
+                last_user = messages[index]
+                break
         text = "MOCK CHAT RESPONSE"
         if last_user:
             text += f": {last_user.content[:80]}"
@@ -502,6 +733,7 @@ class MockBackend(LLMBackend):
 class LLMService:
     def __init__(self, settings: Optional[Settings] = None):
         self._settings = settings or get_settings()
+        self._closed = False
         if self._settings.use_mock_llm or self._settings.model.provider == "mock":
             self._backend: LLMBackend = MockBackend()
         else:
@@ -512,8 +744,10 @@ class LLMService:
                 self._backend = OllamaBackend(self._settings)
             else:
                 raise ValueError(f"Unsupported LLM provider: {provider}")
+        self._response_model_name = self._lookup_model_name(is_chat=False)
+        self._chat_model_name = self._lookup_model_name(is_chat=True)
 
-    def _resolve_model_name(self, *, is_chat: bool = False) -> str:
+    def _lookup_model_name(self, *, is_chat: bool) -> str:
         config = self._settings.model
         if config.provider == "openai" and config.openai:
             return (
@@ -529,42 +763,56 @@ class LLMService:
             )
         return "unknown"
 
+    def _resolve_model_name(self, *, is_chat: bool = False) -> str:
+        return self._chat_model_name if is_chat else self._response_model_name
+
     def _log_call(
         self,
         operation: str,
         *,
         system: Optional[str],
         prompt_text: Optional[str] = None,
-        request_payload: Optional[Dict[str, Any]] = None,
+        request_payload: Optional[Dict[str, Any] | Callable[[], Dict[str, Any]]] = None,
         is_chat: bool = False,
     ) -> None:
-        preview = (prompt_text[:160] + "...") if prompt_text and len(prompt_text) > 160 else prompt_text
+        # DEBUG sits below INFO, so anything listening at DEBUG also wants the INFO summary.
+        if not producer.is_enabled(EventVisibility.INFO):
+            return
+        model = self._resolve_model_name(is_chat=is_chat)
         metadata: Dict[str, Any] = {
             "operation": operation,
             "provider": self._settings.model.provider,
-            "model": self._resolve_model_name(is_chat=is_chat),
+            "model": model,
             "has_system_prompt": bool(system),
         }
         if prompt_text is not None:
-            metadata["prompt_length"] = len(prompt_text)
-        if preview:
-            metadata["prompt_preview"] = preview
-
-        if producer.is_enabled(EventVisibility.INFO):
-            producer.info("Dispatching LLM request", metadata)
+            prompt_length = len(prompt_text)
+            metadata["prompt_length"] = prompt_length
+            if prompt_length:
+                metadata["prompt_preview"] = prompt_text[:160] + "..." if prompt_length > 160 else prompt_text
+        producer.info("Dispatching LLM request", metadata)
 
+        if not producer.is_enabled(EventVisibility.DEBUG):
+            return
+        # Callers may pass a factory so large payloads are only built for DEBUG consumers.
+        if callable(request_payload):
+            request_payload = request_payload()
         file_record = {
             "operation": operation,
             "system": system,
             "is_chat": is_chat,
-            "model": metadata["model"],
+            "model": model,
             "request": request_payload if request_payload is not None else {"prompt": prompt_text},
         }
         producer.debug("LLM request record", file_record)
 
-    def _log_response(self, operation: str, raw: Any) -> None:
-        if raw is None:
+    def _log_response(self, operation: str, raw: Any, *, exclude_none: bool = True) -> None:
+        if raw is None or not producer.is_enabled(EventVisibility.DEBUG):
             return
+        if isinstance(raw, BaseModel):
+            # Provider SDK responses are padded with null fields, so those drop them by default;
+            # structured results pass exclude_none=False so an empty optional field still logs as null.
+            raw = raw.model_dump(mode="json", by_alias=True, exclude_none=exclude_none)
         file_record = {
             "operation": operation,
             "response": raw,
@@ -588,6 +836,24 @@ class LLMService:
         self._log_response("generate_text", getattr(result, "raw", None))
         return result.text
 
+    async def stream_text(
+        self,
+        prompt: str,
+        *,
+        system: Optional[str] = None,
+    ) -> AsyncIterator[str]:
+        """Yield response text as it arrives; wrap in contextlib.aclosing if you may stop early."""
+        self._log_call(
+            "stream_text",
+            system=system,
+            prompt_text=prompt,
+            request_payload={"prompt": prompt, "system": system},
+            is_chat=False,
+        )
+        async with contextlib.aclosing(self._backend.stream_response(prompt, system=system)) as texts:
+            async for text in texts:
+                yield text
+
     async def generate_structured(
         self,
         prompt: str,
@@ -614,13 +880,55 @@ class LLMService:
             schema=schema_hint,
             system=system,
         )
-        if isinstance(result, BaseModel):
-            serialized = result.model_dump(by_alias=True)
-        else:
-            serialized = result
-        self._log_response("generate_structured", serialized)
+        self._log_response("generate_structured", result, exclude_none=False)
         return result
 
+    async def generate_structured_batch(
+        self,
+        prompts: List[str],
+        *,
+        response_model: type[BaseModel],
+        system: Optional[str] = None,
+        concurrency: Optional[int] = None,
+    ) -> List[BaseModel]:
+        """Run independent structured prompts concurrently, returning results in prompt order.
+
+        The first failure cancels the prompts still in flight.
+        """
+        if not prompts:
+            return []
+        if concurrency is None:
+            concurrency = self._settings.model.defaults.batch_concurrency
+        schema_hint = _schema_from_model(response_model)
+        self._log_call(
+            "generate_structured_batch",
+            system=system,
+            request_payload={
+                "prompt_count": len(prompts),
+                "response_model": response_model.__name__,
+                "schema_hint": schema_hint,
+                "system": system,
+                "concurrency": concurrency,
+            },
+            is_chat=False,
+        )
+        semaphore = asyncio.Semaphore(max(1, concurrency))
+
+        async def bounded(prompt: str) -> BaseModel:
+            async with semaphore:
+                result = await self._backend.generate_structured(
+                    prompt,
+                    response_model=response_model,
+                    schema=schema_hint,
+                    system=system,
+                )
+            self._log_response("generate_structured_batch", result, exclude_none=False)
+            return result
+
+        async with asyncio.TaskGroup() as group:
+            tasks = [group.create_task(bounded(prompt)) for prompt in prompts]
+        return [task.result() for task in tasks]
+
     async def chat(
         self,
         messages: List[LLMMessage],
@@ -636,8 +944,8 @@ class LLMService:
             "chat",
             system=system,
             prompt_text=preview,
-            request_payload={
-                "messages": [message.__dict__ for message in messages],
+            request_payload=lambda: {
+                "messages": [message.as_dict() for message in messages],
                 "system": system,
                 "tools": tools,
             },
@@ -666,8 +974,8 @@ class LLMService:
             "chat_with_tools",
             system=system,
             prompt_text=preview,
-            request_payload={
-                "messages": [message.__dict__ for message in messages],
+            request_payload=lambda: {
+                "messages": [message.as_dict() for message in messages],
                 "system": system,
                 "tools": tools,
             },
@@ -683,24 +991,35 @@ class LLMService:
         return result
 
     async def shutdown(self) -> None:
+        if self._closed:
+            return
+        self._closed = True
         await self._backend.aclose()
 
 
 def _collect_openai_text(response: Any) -> str:
-    chunks: List[str] = []
-    output = getattr(response, "output", None) or []
-    for item in output:
-        content_items = getattr(item, "content", None) or []
-        for content in content_items:
-            text = getattr(content, "text", None)
-            if text:
-                chunks.append(text)
-    out = "".join(chunks)
-    if out:
-        return out
-    fallback = getattr(response, "output_text", None)
-    if fallback:
-        return fallback
-    return ""
-
-llm_service = LLMService()
+    # The SDK's output_text already joins the message text parts; walk the items only without it.
+    output_text = getattr(response, "output_text", None)
+    if output_text:
+        return output_text
+    # Function-call output items carry no ``content`` attribute, so items still need getattr.
+    return "".join(
+        text
+        for item in getattr(response, "output", None) or ()
+        for content in getattr(item, "content", None) or ()
+        if (text := getattr(content, "text", None))
+    )
+
+
+@lru_cache(maxsize=1)
+def get_llm_service() -> LLMService:
+    return LLMService()
+
+
+async def shutdown_llm_service() -> None:
+    """Close the shared service if one was created; the next get_llm_service() builds a fresh one."""
+    if not get_llm_service.cache_info().currsize:
+        return
+    service = get_llm_service()
+    get_llm_service.cache_clear()
+    await service.shutdown()
@@ -1,24 +1,31 @@
 from __future__ import annotations
 
 import asyncio
-from datetime import datetime
+import re
+import time
 import uuid
 import textwrap
-from typing import Dict, List, Optional
+from typing import Dict, List
 
 from fastapi import BackgroundTasks, HTTPException
 
 from app.eventing import get_event_producer
 from app.schemas.checklists import EvidenceCategoryCollection, EvidenceCollection, EvidenceItem, EvidencePointer
-from app.schemas.documents import DocumentReference
+from app.schemas.documents import DOCUMENT_SORT_KEY, DocumentReference
 from app.schemas.summary import SummaryJob, SummaryJobStatus, SummaryRequest
-from app.services.documents import get_document
-from app.services.llm import llm_service
+from app.services.documents import list_documents
+from app.services.llm import get_llm_service
 
 producer = get_event_producer(__name__)
 
 _summary_jobs: Dict[str, SummaryJob] = {}
 _summary_jobs_lock = asyncio.Lock()
+# Finished job ids in completion order, mapped to their monotonic finish time.
+_finished_summary_jobs: Dict[str, float] = {}
+
+_FINISHED_JOB_TTL_SECONDS = 3600.0
+_MAX_FINISHED_JOBS = 1000
+_TERMINAL_STATUSES = frozenset({SummaryJobStatus.succeeded, SummaryJobStatus.failed})
 
 STYLE_ONE_SHOT = textwrap.dedent(
     """
@@ -72,6 +79,7 @@ async def create_summary_job(case_id: str, request: SummaryRequest, background_t
     job_id = str(uuid.uuid4())
     job = SummaryJob(id=job_id, case_id=case_id, status=SummaryJobStatus.pending)
     async with _summary_jobs_lock:
+        _evict_finished_jobs()
         _summary_jobs[job_id] = job
     background_tasks.add_task(_run_summary_job, job_id, case_id, request)
     return job
@@ -81,16 +89,16 @@ async def _run_summary_job(job_id: str, case_id: str, request: SummaryRequest) -
     await _update_job(job_id, status=SummaryJobStatus.running)
 
     try:
-        sorted_docs = sorted(request.documents, key=_document_sort_key)
+        sorted_docs = sorted(request.documents, key=DOCUMENT_SORT_KEY)
         evidence = _flatten_checklist(request.checklist, sorted_docs)
-        doc_titles = _build_document_titles(case_id, sorted_docs)
+        doc_titles = await _build_document_titles(case_id, sorted_docs)
         ordered_items = _order_evidence_items(evidence, doc_titles)
         evidence_block = _format_evidence_block(ordered_items, doc_titles)
 
         prompt_template = request.prompt if request.prompt is not None else DEFAULT_SUMMARY_PROMPT
         prompt = prompt_template.replace("{evidence_block}", evidence_block)
 
-        summary_text = await llm_service.generate_text(prompt)
+        summary_text = await get_llm_service().generate_text(prompt)
         await _update_job(job_id, status=SummaryJobStatus.succeeded, summary_text=summary_text.strip())
     except HTTPException:
         raise
@@ -107,50 +115,65 @@ async def _update_job(job_id: str, **updates) -> None:
         job = _summary_jobs.get(job_id)
         if not job:
             return
-        updated = job.model_copy(update=updates)
-        _summary_jobs[job_id] = updated
+        # SummaryJob does not validate on assignment, so this is a plain attribute write per field.
+        for field_name, value in updates.items():
+            setattr(job, field_name, value)
+        if job.status in _TERMINAL_STATUSES:
+            _finished_summary_jobs[job_id] = time.monotonic()
+
+
+def _evict_finished_jobs() -> None:
+    """Drop expired or excess finished jobs; callers must hold the jobs lock.
+
+    Pending and running jobs are never evicted. Finished ids are kept in completion
+    order, so this stops at the first job that is both young enough and within the cap.
+    """
+    cutoff = time.monotonic() - _FINISHED_JOB_TTL_SECONDS
+    excess = len(_finished_summary_jobs) - _MAX_FINISHED_JOBS
+    while _finished_summary_jobs:
+        job_id, finished_at = next(iter(_finished_summary_jobs.items()))
+        if excess <= 0 and finished_at > cutoff:
+            break
+        del _finished_summary_jobs[job_id]
+        _summary_jobs.pop(job_id, None)
+        excess -= 1
 
 
 async def get_summary_job(job_id: str) -> SummaryJob:
-    async with _summary_jobs_lock:
-        job = _summary_jobs.get(job_id)
+    # Single dict lookup; the lock only guards the write paths.
+    job = _summary_jobs.get(job_id)
     if not job:
         raise HTTPException(status_code=404, detail="Summary job not found")
     return job
 
 
-def _parse_date(value: Optional[str]) -> Optional[datetime]:
-    if not value:
-        return None
-    try:
-        return datetime.fromisoformat(value)
-    except ValueError:
-        return None
-
-
-def _document_sort_key(document: DocumentReference) -> tuple:
-    if getattr(document, "is_docket", False):
-        return (0, document.id)
-    date_value = _parse_date(getattr(document, "date", None))
-    if date_value is None:
-        return (1, 1, 0, document.id)
-    return (1, 0, -date_value.timestamp(), document.id)
-
-
-def _build_document_titles(case_id: str, documents: List[DocumentReference]) -> Dict[int, str]:
+async def _build_document_titles(case_id: str, documents: List[DocumentReference]) -> Dict[int, str]:
     titles: Dict[int, str] = {}
+    missing: List[DocumentReference] = []
     for ref in documents:
         display_title = ref.title or ref.alias
         if display_title is None:
-            try:
-                doc = get_document(case_id, ref.id)
-                display_title = doc.title or doc.id
-            except Exception:  # pylint: disable=broad-except
-                display_title = ref.id
-        titles[int(ref.id)] = str(display_title)
+            # Reserve the slot now: the insertion order of titles drives evidence ordering.
+            titles[int(ref.id)] = str(ref.id)
+            missing.append(ref)
+        else:
+            titles[int(ref.id)] = str(display_title)
+    if missing:
+        # One pass over the case's documents instead of a get_document scan per reference.
+        stored_titles = await asyncio.to_thread(_lookup_document_titles, case_id)
+        for ref in missing:
+            titles[int(ref.id)] = stored_titles.get(int(ref.id), str(ref.id))
     return titles
 
 
+def _lookup_document_titles(case_id: str) -> Dict[int, str]:
+    try:
+        documents = list_documents(case_id)
+    except Exception:  # pylint: disable=broad-except
+        return {}
+    return {int(doc.id): str(doc.title or doc.id) for doc in documents}
+
+
 def _flatten_checklist(
     checklist: EvidenceCategoryCollection, documents: List[DocumentReference]
 ) -> EvidenceCollection:
@@ -196,18 +219,26 @@ def _order_evidence_items(evidence: EvidenceCollection, titles: Dict[int, str])
     )
 
 
+_NON_SPACE_RE = re.compile(r"\S")
+
+
 def _format_evidence_block(items: List[EvidenceItem], titles: Dict[int, str]) -> str:
     lines: List[str] = []
+    append = lines.append
     for item in items:
-        doc_id = item.evidence.document_id
-        title = titles.get(doc_id, f"Document {doc_id}")
-        evidence_text = item.evidence.text or ""
-        evidence_text = evidence_text.replace("\n", " ").strip()
-        if len(evidence_text) > 400:
-            evidence_text = evidence_text[:400] + " ..."
+        evidence = item.evidence
+        doc_id = evidence.document_id
+        title = titles.get(doc_id)
+        if title is None:
+            title = f"Document {doc_id}"
+        # Only the first 400 characters are ever shown, so cut before the O(n) replace.
+        evidence_text = (evidence.text or "").lstrip()
+        if _NON_SPACE_RE.search(evidence_text, 400):
+            evidence_text = evidence_text[:400].replace("\n", " ") + " ..."
+        else:
+            evidence_text = evidence_text[:400].replace("\n", " ").rstrip()
         snippet = f' "{evidence_text}"' if evidence_text else ""
-        offset_part = ""
-        if item.evidence.start_offset is not None and item.evidence.end_offset is not None:
-            offset_part = f" offsets [{item.evidence.start_offset}-{item.evidence.end_offset}]"
-        lines.append(f"- Doc {doc_id} - {title}: [{item.bin_id}] {item.value}{offset_part}{snippet}")
+        start, end = evidence.start_offset, evidence.end_offset
+        offset_part = f" offsets [{start}-{end}]" if start is not None and end is not None else ""
+        append(f"- Doc {doc_id} - {title}: [{item.bin_id}] {item.value}{offset_part}{snippet}")
     return "\n".join(lines)
@@ -0,0 +1,12 @@
+from __future__ import annotations
+
+
+def normalize_case_id(case_id: str) -> str:
+    """Ensure case identifiers serialize consistently."""
+    if isinstance(case_id, str) and case_id.isascii() and case_id.isdigit() and (case_id[0] != "0" or case_id == "0"):
+        return case_id
+    try:
+        # Preserve numeric IDs as canonical decimal strings for compatibility with JSON object keys.
+        return str(int(case_id))
+    except (TypeError, ValueError):
+        return str(case_id)
@@ -0,0 +1,17 @@
+from __future__ import annotations
+
+import os
+import sys
+import tempfile
+from pathlib import Path
+
+# Settings are read at import time, so point them at a throwaway database before any app import.
+_TEST_DB_DIR = tempfile.mkdtemp(prefix="legal-case-tests-")
+os.environ.setdefault("LEGAL_CASE_DATABASE_URL", f"sqlite:///{Path(_TEST_DB_DIR) / 'test.db'}")
+os.environ.setdefault("LEGAL_CASE_USE_MOCK_LLM", "true")
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+
+from app.db.session import init_db  # noqa: E402
+
+init_db()
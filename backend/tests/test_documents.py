@@ -0,0 +1,75 @@
+from __future__ import annotations
+
+from app.schemas.documents import Document, DocumentReference
+from app.services import documents
+
+
+def _document(doc_id: int, **overrides) -> Document:
+    fields = {"id": doc_id, "title": f"Document {doc_id}", "content": f"Body {doc_id}"}
+    fields.update(overrides)
+    return Document(**fields)
+
+
+def test_flush_pending_writes_persists_scheduled_case() -> None:
+    docs = [_document(1), _document(2, date="2024-01-02")]
+    documents._schedule_persist("flush-case", docs, "Flush v. Case")
+
+    documents.flush_pending_writes()
+
+    stored = documents._CASE_STORE.get("flush-case")
+    assert stored is not None
+    assert stored.case_title == "Flush v. Case"
+    assert sorted(item["id"] for item in stored.documents) == [1, 2]
+    assert documents._persist_worker is None
+
+
+def test_schedule_after_flush_starts_a_new_worker() -> None:
+    documents.flush_pending_writes()
+    documents._schedule_persist("restart-case", [_document(3)], "Restart v. Case")
+
+    documents.flush_pending_writes()
+
+    stored = documents._CASE_STORE.get("restart-case")
+    assert stored is not None
+    assert [item["id"] for item in stored.documents] == [3]
+
+
+def test_case_cache_evicts_least_recently_used(monkeypatch) -> None:
+    monkeypatch.setattr(documents, "_MAX_CACHED_CASES", 2)
+    monkeypatch.setattr(documents, "_CASE_CACHE", documents.OrderedDict())
+    monkeypatch.setattr(documents, "_CASE_TITLE_CACHE", {})
+
+    documents._cache_documents("case-a", [_document(1)], "A v. B")
+    documents._cache_documents("case-b", [_document(2)], "B v. C")
+    # Reading case-a makes case-b the least recently used entry.
+    assert documents._get_cached_documents("case-a") is not None
+    documents._cache_documents("case-c", [_document(3)], "C v. D")
+
+    assert list(documents._CASE_CACHE) == ["case-a", "case-c"]
+    assert documents._CASE_TITLE_CACHE == {"case-a": "A v. B", "case-c": "C v. D"}
+    assert documents._get_cached_documents("case-b") is None
+
+
+def test_sort_key_follows_model_copy_update() -> None:
+    older = _document(1, date="2020-01-01")
+    newer = _document(2, date="2021-06-01")
+    assert documents._sort_documents([older, newer]) == [newer, older]
+
+    moved = older.model_copy(update={"date": "2023-03-03"})
+
+    assert documents._sort_documents([moved, newer]) == [moved, newer]
+
+
+def test_reference_sort_key_matches_document_order() -> None:
+    docs = [
+        _document(4),
+        _document(3, date="2019-05-05"),
+        _document(2, is_docket=True),
+        _document(1, date="2022-02-02"),
+    ]
+    refs = [DocumentReference(id=doc.id, date=doc.date, is_docket=doc.is_docket) for doc in docs]
+
+    expected = [doc.id for doc in documents._sort_documents(docs)]
+
+    assert expected == [2, 1, 3, 4]
+    assert [ref.id for ref in sorted(refs, key=lambda ref: ref.sort_key)] == expected
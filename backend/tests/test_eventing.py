@@ -0,0 +1,74 @@
+from __future__ import annotations
+
+import asyncio
+from typing import List
+
+from app.eventing import BaseEventConsumer, Event, EventManager, EventVisibility, _dump_json
+
+
+class _RecordingConsumer(BaseEventConsumer):
+    def __init__(self, *, fail_on: str | None = None) -> None:
+        super().__init__(min_level=EventVisibility.TRACE)
+        self.fail_on = fail_on
+        self.events: List[str] = []
+        self.flushes = 0
+
+    async def handle_event(self, event: Event) -> None:
+        if self.fail_on == "handle_event":
+            raise RuntimeError("disk full")
+        self.events.append(event.description)
+
+    async def flush(self) -> None:
+        if self.fail_on == "flush":
+            raise OSError("disk full")
+        self.flushes += 1
+
+
+def _event(description: str) -> Event:
+    return Event(
+        timestamp="2024-01-01T00:00:00Z",
+        visibility=EventVisibility.INFO,
+        producer="tests",
+        description=description,
+    )
+
+
+def test_flush_failure_is_reported_and_other_consumers_still_flush(capsys) -> None:
+    failing, healthy = _RecordingConsumer(fail_on="flush"), _RecordingConsumer()
+
+    asyncio.run(EventManager()._flush_consumers([failing, healthy]))
+
+    assert healthy.flushes == 1
+    assert "_RecordingConsumer.flush failed: OSError('disk full')" in capsys.readouterr().err
+
+
+def test_handle_event_failure_is_reported(capsys) -> None:
+    failing, healthy = _RecordingConsumer(fail_on="handle_event"), _RecordingConsumer()
+
+    asyncio.run(EventManager()._dispatch([_event("one"), _event("two")], [failing, healthy]))
+
+    assert healthy.events == ["one", "two"]
+    assert capsys.readouterr().err.count("_RecordingConsumer.handle_event failed") == 2
+
+
+def test_base_consumer_flush_is_a_no_op() -> None:
+    consumer = BaseEventConsumer(min_level=EventVisibility.INFO)
+
+    assert asyncio.run(consumer.flush()) is None
+
+
+class _Marker:
+    def __str__(self) -> str:
+        return "value"
+
+
+def test_dump_json_tiers_produce_the_same_format() -> None:
+    payload = {"name": "Zoë ✓", "values": [1, 2.5, None, True], 3: {"nested": "ok"}}
+
+    native = _dump_json({"extra": "value", **payload})
+    with_default = _dump_json({"extra": _Marker(), **payload})
+    with_stdlib = _dump_json({"extra": "value", **payload, "big": 2**70})
+
+    assert native == '{"extra":"value","name":"Zoë ✓","values":[1,2.5,null,true],"3":{"nested":"ok"}}'
+    assert with_default.encode("utf-8") == native.encode("utf-8")
+    assert with_stdlib.encode("utf-8") == (native[:-1] + f',"big":{2**70}}}').encode("utf-8")
@@ -0,0 +1,162 @@
+from __future__ import annotations
+
+import asyncio
+import contextlib
+import json
+import random
+from types import SimpleNamespace
+from typing import Any, Dict, List
+
+import httpx
+import pytest
+
+from app.core.config import ModelConfig, OllamaModelConfig
+from app.services.llm import (
+    LLMMessage,
+    OllamaBackend,
+    OllamaStreamError,
+    _strip_reasoning_stream,
+    _strip_reasoning_tokens,
+)
+
+
+def _ndjson(chunks: List[Dict[str, Any]]) -> bytes:
+    return b"".join(json.dumps(chunk).encode() + b"\n" for chunk in chunks)
+
+
+def _backend(chunks: List[Dict[str, Any]], *, max_concurrency: int | None = None) -> OllamaBackend:
+    config = OllamaModelConfig(
+        base_url="http://ollama.test",
+        response_model="test-model",
+        max_concurrency=max_concurrency,
+    )
+    backend = OllamaBackend(SimpleNamespace(model=ModelConfig(provider="ollama", ollama=config)))
+    body = _ndjson(chunks)
+    backend._client = httpx.AsyncClient(
+        base_url=config.base_url,
+        transport=httpx.MockTransport(lambda request: httpx.Response(200, content=body)),
+    )
+    return backend
+
+
+def _generate_chunks(*texts: str) -> List[Dict[str, Any]]:
+    chunks: List[Dict[str, Any]] = [{"response": text, "done": False} for text in texts]
+    chunks.append({"response": "", "done": True, "eval_count": len(texts)})
+    return chunks
+
+
+async def _collect_stream(backend: OllamaBackend) -> str:
+    parts = []
+    async with contextlib.aclosing(backend.stream_response("prompt")) as texts:
+        async for text in texts:
+            parts.append(text)
+    return "".join(parts)
+
+
+def test_generate_response_joins_chunks_and_strips_reasoning() -> None:
+    backend = _backend(_generate_chunks("<thi", "nk>plan</th", "ink>\n", "Hello", " world"))
+
+    result = asyncio.run(backend.generate_response("prompt"))
+
+    assert result.text == "Hello world"
+    assert result.raw["eval_count"] == 5
+
+
+def test_stream_response_strips_split_think_tags() -> None:
+    backend = _backend(_generate_chunks("<thi", "nk>plan</th", "ink>", "\nHello", " world"))
+
+    assert asyncio.run(_collect_stream(backend)) == "Hello world"
+
+
+def test_error_chunk_raises() -> None:
+    chunks = [{"response": "partial", "done": False}, {"error": "model runner crashed"}]
+
+    with pytest.raises(OllamaStreamError, match="model runner crashed"):
+        asyncio.run(_backend(chunks).generate_response("prompt"))
+    with pytest.raises(OllamaStreamError, match="model runner crashed"):
+        asyncio.run(_collect_stream(_backend(chunks)))
+
+
+def test_missing_done_chunk_raises() -> None:
+    chunks = [{"response": "truncated", "done": False}]
+
+    with pytest.raises(OllamaStreamError, match="done chunk"):
+        asyncio.run(_backend(chunks).generate_response("prompt"))
+    with pytest.raises(OllamaStreamError, match="done chunk"):
+        asyncio.run(_collect_stream(_backend(chunks)))
+
+
+def test_chat_merges_tool_calls_across_chunks() -> None:
+    first = {"function": {"name": "search", "arguments": {"query": "docket"}}}
+    second = {"function": {"name": "read", "arguments": {"doc_id": 7}}}
+    chunks = [
+        {"message": {"role": "assistant", "content": "Looking", "tool_calls": [first]}, "done": False},
+        {"message": {"role": "assistant", "content": " now", "tool_calls": [second]}, "done": False},
+        {"message": {"role": "assistant", "content": ""}, "done": True},
+    ]
+
+    result = asyncio.run(_backend(chunks).chat([LLMMessage(role="user", content="hi")]))
+
+    assert result.text == "Looking now"
+    assert [(call.name, json.loads(call.arguments)) for call in result.tool_calls] == [
+        ("search", {"query": "docket"}),
+        ("read", {"doc_id": 7}),
+    ]
+    assert result.raw["message"]["tool_calls"] == [first, second]
+
+
+def test_closing_stream_early_releases_request_slot() -> None:
+    backend = _backend(_generate_chunks("one", " two", " three"), max_concurrency=1)
+
+    async def read_first() -> str:
+        async with contextlib.aclosing(backend.stream_response("prompt")) as texts:
+            async for text in texts:
+                return text
+        return ""
+
+    async def run() -> None:
+        assert await read_first() == "one"
+        assert not backend._semaphore.locked()
+        # A second request must not wait on the slot the abandoned stream held.
+        result = await asyncio.wait_for(backend.generate_response("prompt"), timeout=1)
+        assert result.text == "one two three"
+
+    asyncio.run(run())
+
+
+@pytest.mark.parametrize(
+    "text",
+    [
+        "<think>reasoning</think>\nAnswer",
+        "Before <think>a</think>middle<think>b</think>\n\nafter",
+        "Answer with an unterminated <think>tail that never closes",
+        "Stray </think> and a <thin partial tag",
+        "<think>nested <think> open</think>\nrest",
+    ],
+)
+def test_strip_reasoning_stream_matches_buffered_strip(text: str) -> None:
+    async def chunked(pieces: List[str]):
+        for piece in pieces:
+            yield piece
+
+    async def joined(pieces: List[str]) -> str:
+        return "".join([part async for part in _strip_reasoning_stream(chunked(pieces))])
+
+    rng = random.Random(text)
+    expected = _strip_reasoning_tokens(text)
+    for _ in range(50):
+        cuts = sorted(rng.sample(range(1, len(text)), k=min(len(text) - 1, rng.randint(1, 8))))
+        pieces = [text[start:end] for start, end in zip([0, *cuts], [*cuts, len(text)])]
+        assert asyncio.run(joined(pieces)) == expected
+    assert asyncio.run(joined(list(text))) == expected
+
+
+@pytest.mark.parametrize("keep_alive", [-1, 0, "30m"])
+def test_keep_alive_is_sent_with_its_configured_type(keep_alive: int | str) -> None:
+    config = OllamaModelConfig.model_validate(
+        {"base_url": "http://ollama.test", "response_model": "test-model", "keep_alive": keep_alive}
+    )
+    backend = OllamaBackend(SimpleNamespace(model=ModelConfig(provider="ollama", ollama=config)))
+
+    assert config.keep_alive == keep_alive
+    assert json.loads(backend._encode({"model": "test-model"}))["keep_alive"] == keep_alive
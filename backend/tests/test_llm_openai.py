@@ -0,0 +1,104 @@
+from __future__ import annotations
+
+import asyncio
+import contextlib
+import importlib
+import json
+from types import SimpleNamespace
+from typing import Any, Dict, List
+
+from openai import AsyncOpenAI, DefaultAsyncHttpxClient
+
+from app.core.config import ModelConfig, OpenAIModelConfig
+from app.services.llm import OpenAIBackend
+
+# Use whichever httpx distribution the installed SDK is built on for the mock transport.
+sdk_httpx = importlib.import_module(DefaultAsyncHttpxClient.__mro__[1].__module__.partition(".")[0])
+
+_MESSAGE = {
+    "type": "message",
+    "id": "msg_1",
+    "role": "assistant",
+    "status": "incomplete",
+    "content": [{"type": "output_text", "text": "Partial answer", "annotations": []}],
+}
+_INCOMPLETE_RESPONSE = {
+    "id": "resp_1",
+    "object": "response",
+    "created_at": 0,
+    "model": "test-model",
+    "status": "incomplete",
+    "incomplete_details": {"reason": "max_output_tokens"},
+    "output": [_MESSAGE],
+    "parallel_tool_calls": True,
+    "tool_choice": "auto",
+    "tools": [],
+}
+
+
+def _backend(handler) -> OpenAIBackend:
+    config = OpenAIModelConfig(response_model="test-model", reasoning_effort="low", api_key="test-key")
+    settings = SimpleNamespace(
+        model=ModelConfig(provider="openai", openai=config),
+        resolve_openai_api_key=lambda: "test-key",
+    )
+    backend = OpenAIBackend(settings)
+    backend._client = AsyncOpenAI(
+        api_key="test-key",
+        http_client=DefaultAsyncHttpxClient(transport=sdk_httpx.MockTransport(handler)),
+    )
+    return backend
+
+
+def _event_stream(events: List[Dict[str, Any]]) -> str:
+    return "".join(f"event: {event['type']}\ndata: {json.dumps(event)}\n\n" for event in events)
+
+
+def test_generate_response_returns_incomplete_response() -> None:
+    requests: List[Dict[str, Any]] = []
+
+    def handler(request: sdk_httpx.Request) -> sdk_httpx.Response:
+        requests.append(json.loads(request.content))
+        return sdk_httpx.Response(200, json=_INCOMPLETE_RESPONSE)
+
+    result = asyncio.run(_backend(handler).generate_response("prompt"))
+
+    assert result.text == "Partial answer"
+    assert result.raw.status == "incomplete"
+    assert result.raw.incomplete_details.reason == "max_output_tokens"
+    assert not requests[0].get("stream")
+
+
+def test_stream_response_yields_deltas_until_incomplete() -> None:
+    in_progress = {**_INCOMPLETE_RESPONSE, "status": "in_progress", "incomplete_details": None, "output": []}
+    delta = {"item_id": "msg_1", "output_index": 0, "content_index": 0, "logprobs": []}
+    events = [
+        {"type": "response.created", "sequence_number": 0, "response": in_progress},
+        {
+            "type": "response.output_item.added",
+            "sequence_number": 1,
+            "output_index": 0,
+            "item": {**_MESSAGE, "status": "in_progress", "content": []},
+        },
+        {
+            "type": "response.content_part.added",
+            "sequence_number": 2,
+            "item_id": "msg_1",
+            "output_index": 0,
+            "content_index": 0,
+            "part": {"type": "output_text", "text": "", "annotations": []},
+        },
+        {"type": "response.output_text.delta", "sequence_number": 3, "delta": "Partial", **delta},
+        {"type": "response.output_text.delta", "sequence_number": 4, "delta": " answer", **delta},
+        {"type": "response.incomplete", "sequence_number": 5, "response": _INCOMPLETE_RESPONSE},
+    ]
+    body = _event_stream(events)
+
+    def handler(request: sdk_httpx.Request) -> sdk_httpx.Response:
+        return sdk_httpx.Response(200, headers={"content-type": "text/event-stream"}, text=body)
+
+    async def collect() -> List[str]:
+        async with contextlib.aclosing(_backend(handler).stream_response("prompt")) as texts:
+            return [text async for text in texts]
+
+    assert asyncio.run(collect()) == ["Partial", " answer"]
@@ -0,0 +1,100 @@
+from __future__ import annotations
+
+import asyncio
+from typing import Any, Dict, List, Optional
+
+import pytest
+
+from pydantic import BaseModel, Field
+
+from app.services import llm
+from app.services.llm import LLMBackend, LLMService
+
+
+class _Finding(BaseModel):
+    label: str
+    detail: Optional[str] = Field(None, alias="detailText")
+
+
+class _DebugProducer:
+    def __init__(self) -> None:
+        self.records: List[Dict[str, Any]] = []
+
+    def is_enabled(self, level: Any) -> bool:
+        return True
+
+    def debug(self, description: str, payload: Dict[str, Any]) -> None:
+        self.records.append(payload)
+
+
+def test_structured_results_log_explicit_nulls(monkeypatch) -> None:
+    debug = _DebugProducer()
+    monkeypatch.setattr(llm, "producer", debug)
+    service = LLMService()
+    finding = _Finding(label="claim")
+
+    service._log_response("generate_structured", finding, exclude_none=False)
+    service._log_response("generate_text", finding)
+
+    assert debug.records[0]["response"] == {"label": "claim", "detailText": None}
+    assert debug.records[1]["response"] == {"label": "claim"}
+
+
+class _SlowStructuredBackend(LLMBackend):
+    def __init__(self, *, fail_on: Optional[str] = None) -> None:
+        self.fail_on = fail_on
+        self.in_flight = 0
+        self.peak = 0
+        self.cancelled: List[str] = []
+
+    async def generate_structured(self, prompt: str, *, response_model, schema: str, system=None) -> BaseModel:
+        self.in_flight += 1
+        self.peak = max(self.peak, self.in_flight)
+        try:
+            # Later prompts finish first, so ordering cannot come from completion order.
+            await asyncio.sleep(0.05 if prompt == "slow" else 0.01 / (1 + len(prompt)))
+            if prompt == self.fail_on:
+                raise ValueError(f"bad output for {prompt}")
+            return response_model(label=prompt)
+        except asyncio.CancelledError:
+            self.cancelled.append(prompt)
+            raise
+        finally:
+            self.in_flight -= 1
+
+
+def _batch_service(backend: LLMBackend) -> LLMService:
+    service = LLMService()
+    service._backend = backend
+    return service
+
+
+def test_structured_batch_keeps_prompt_order_and_caps_concurrency() -> None:
+    backend = _SlowStructuredBackend()
+    prompts = ["a", "bb", "ccc", "dddd", "eeeee", "ffffff"]
+
+    results = asyncio.run(
+        _batch_service(backend).generate_structured_batch(prompts, response_model=_Finding, concurrency=2)
+    )
+
+    assert [result.label for result in results] == prompts
+    assert backend.peak == 2
+
+
+def test_structured_batch_failure_cancels_prompts_in_flight() -> None:
+    backend = _SlowStructuredBackend(fail_on="x")
+
+    with pytest.raises(ExceptionGroup) as excinfo:
+        asyncio.run(
+            _batch_service(backend).generate_structured_batch(["slow", "x"], response_model=_Finding, concurrency=2)
+        )
+
+    assert [str(exc) for exc in excinfo.value.exceptions] == ["bad output for x"]
+    assert backend.cancelled == ["slow"]
+
+
+def test_structured_batch_of_nothing_skips_the_backend() -> None:
+    backend = _SlowStructuredBackend()
+
+    assert asyncio.run(_batch_service(backend).generate_structured_batch([], response_model=_Finding)) == []
+    assert backend.peak == 0
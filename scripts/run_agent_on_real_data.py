@@ -2,7 +2,6 @@
 import asyncio
 import logging
 import sys
-import json
 from pathlib import Path
 
 # Add backend to path
@@ -10,7 +9,7 @@ sys.path.append(str(Path(__file__).resolve().parents[1] / "backend"))
 
 from app.services.agent.driver import AgentDriver
 from app.core.config import get_settings
-from app.services.llm import llm_service
+from app.services.llm import get_llm_service
 
 # Configure detailed logging to stdout
 logging.basicConfig(
@@ -37,13 +36,13 @@ async def main():
         result = await driver.run()
         
         print("\n\n=== Extraction Complete ===")
-        print(json.dumps(result.model_dump(), indent=2, default=str))
+        print(result.model_dump_json(indent=2))
         
     except Exception as e:
         logger.exception("Extraction failed")
         
     finally:
-        await llm_service.shutdown()
+        await get_llm_service().shutdown()
 
 if __name__ == "__main__":
     asyncio.run(main())